@@ -0,0 +1,173 @@
+import numpy as np
+import pytest
+
+from trackeval.datasets._base_dataset import _BaseDataset
+
+
+def _reference_box_ious(bboxes1, bboxes2, box_format='xywh', do_ioa=False):
+    """Straightforward per-pair reference implementation to validate the vectorized version."""
+    if box_format == 'xywh':
+        bboxes1 = np.concatenate([bboxes1[:, :2], bboxes1[:, :2] + bboxes1[:, 2:]], axis=1)
+        bboxes2 = np.concatenate([bboxes2[:, :2], bboxes2[:, :2] + bboxes2[:, 2:]], axis=1)
+    scores = np.zeros((len(bboxes1), len(bboxes2)))
+    for i, b1 in enumerate(bboxes1):
+        for j, b2 in enumerate(bboxes2):
+            iw = max(0, min(b1[2], b2[2]) - max(b1[0], b2[0]))
+            ih = max(0, min(b1[3], b2[3]) - max(b1[1], b2[1]))
+            intersection = iw * ih
+            area1 = (b1[2] - b1[0]) * (b1[3] - b1[1])
+            area2 = (b2[2] - b2[0]) * (b2[3] - b2[1])
+            if do_ioa:
+                scores[i, j] = intersection / area1 if area1 > 0 else 0
+            else:
+                union = area1 + area2 - intersection
+                if area1 <= 0 or area2 <= 0 or union <= 0:
+                    scores[i, j] = 0
+                else:
+                    scores[i, j] = intersection / union
+    return scores
+
+
+@pytest.mark.parametrize('box_format', ['xywh', 'x0y0x1y1'])
+@pytest.mark.parametrize('do_ioa', [False, True])
+def test_box_ious_matches_reference(box_format, do_ioa):
+    rng = np.random.RandomState(0)
+    bboxes1 = rng.uniform(0, 100, size=(17, 4))
+    bboxes2 = rng.uniform(0, 100, size=(23, 4))
+    if box_format == 'x0y0x1y1':
+        # Make boxes well-formed (x1 >= x0, y1 >= y0).
+        bboxes1[:, 2:] += bboxes1[:, :2]
+        bboxes2[:, 2:] += bboxes2[:, :2]
+    actual = _BaseDataset._calculate_box_ious(bboxes1, bboxes2, box_format=box_format, do_ioa=do_ioa)
+    expected = _reference_box_ious(bboxes1, bboxes2, box_format=box_format, do_ioa=do_ioa)
+    np.testing.assert_allclose(actual, expected, atol=1e-12)
+    assert (actual >= 0).all()
+    if not do_ioa:
+        assert (actual <= 1 + np.finfo('float').eps).all()
+
+
+@pytest.mark.parametrize('do_ioa', [False, True])
+def test_box_ious_float32(do_ioa):
+    rng = np.random.RandomState(1)
+    bboxes1 = rng.uniform(0, 100, size=(11, 4)).astype(np.float32)
+    bboxes2 = rng.uniform(0, 100, size=(13, 4)).astype(np.float32)
+    actual = _BaseDataset._calculate_box_ious(bboxes1, bboxes2, box_format='xywh', do_ioa=do_ioa)
+    expected = _reference_box_ious(bboxes1.astype(float), bboxes2.astype(float), box_format='xywh', do_ioa=do_ioa)
+    assert actual.dtype == np.float32
+    np.testing.assert_allclose(actual, expected, atol=1e-5)
+
+
+@pytest.mark.parametrize('do_ioa', [False, True])
+def test_box_ious_float16_compute(do_ioa):
+    # Integer-valued corner coordinates below 2048 are exactly representable in float16.
+    rng = np.random.RandomState(2)
+    bboxes1 = rng.randint(0, 1000, size=(15, 4)).astype(float)
+    bboxes2 = rng.randint(0, 1000, size=(19, 4)).astype(float)
+    actual = _BaseDataset._calculate_box_ious(bboxes1, bboxes2, box_format='xywh', do_ioa=do_ioa,
+                                              dtype=np.float16)
+    expected = _reference_box_ious(bboxes1, bboxes2, box_format='xywh', do_ioa=do_ioa)
+    assert np.isfinite(actual).all()
+    np.testing.assert_allclose(actual, expected, atol=1e-3)
+
+
+@pytest.mark.parametrize('do_ioa', [False, True])
+def test_box_ious_integer_boxes(monkeypatch, do_ioa):
+    # MOT coordinates are integers; the NumPy path must still return float scores for them.
+    from trackeval.datasets import _iou_numba
+    monkeypatch.setattr(_iou_numba, 'NUMBA_AVAILABLE', False)
+    rng = np.random.RandomState(6)
+    bboxes1 = rng.randint(0, 100, size=(9, 4))
+    bboxes2 = rng.randint(0, 100, size=(11, 4))
+    actual = _BaseDataset._calculate_box_ious(bboxes1, bboxes2, box_format='xywh', do_ioa=do_ioa)
+    expected = _reference_box_ious(bboxes1.astype(float), bboxes2.astype(float), box_format='xywh', do_ioa=do_ioa)
+    assert np.issubdtype(actual.dtype, np.floating)
+    np.testing.assert_allclose(actual, expected, atol=1e-12)
+
+
+def test_box_ious_precomputed_areas():
+    rng = np.random.RandomState(3)
+    bboxes1 = rng.uniform(0, 100, size=(7, 4))
+    bboxes2 = rng.uniform(0, 100, size=(9, 4))
+    areas1 = bboxes1[:, 2] * bboxes1[:, 3]
+    areas2 = bboxes2[:, 2] * bboxes2[:, 3]
+    expected = _BaseDataset._calculate_box_ious(bboxes1, bboxes2, box_format='xywh')
+    actual = _BaseDataset._calculate_box_ious(bboxes1, bboxes2, box_format='xywh',
+                                              areas1=areas1, areas2=areas2)
+    np.testing.assert_allclose(actual, expected, atol=1e-12)
+    # The provided areas really are used: doubling them must change the result.
+    doubled = _BaseDataset._calculate_box_ious(bboxes1, bboxes2, box_format='xywh',
+                                               areas1=2 * areas1, areas2=2 * areas2)
+    assert not np.allclose(doubled, expected)
+
+
+@pytest.mark.parametrize('do_ioa', [False, True])
+def test_box_ious_out_buffer(do_ioa):
+    rng = np.random.RandomState(4)
+    bboxes1 = rng.uniform(0, 100, size=(6, 4))
+    bboxes2 = rng.uniform(0, 100, size=(8, 4))
+    expected = _BaseDataset._calculate_box_ious(bboxes1, bboxes2, box_format='xywh', do_ioa=do_ioa)
+    scratch = np.full((10, 10), np.nan)
+    result = _BaseDataset._calculate_box_ious(bboxes1, bboxes2, box_format='xywh', do_ioa=do_ioa,
+                                              out=scratch[:6, :8])
+    assert result.base is scratch
+    np.testing.assert_allclose(result, expected, atol=1e-12)
+    # The same scratch array can serve a differently-shaped follow-up call.
+    result2 = _BaseDataset._calculate_box_ious(bboxes2, bboxes1, box_format='xywh', do_ioa=do_ioa,
+                                               out=scratch[:8, :6])
+    expected2 = _reference_box_ious(bboxes2, bboxes1, box_format='xywh', do_ioa=do_ioa)
+    np.testing.assert_allclose(result2, expected2, atol=1e-12)
+
+
+def test_box_ious_zero_area_boxes():
+    bboxes1 = np.array([[0., 0., 0., 0.], [0., 0., 10., 10.]])
+    bboxes2 = np.array([[0., 0., 10., 10.], [5., 5., 0., 0.]])
+    ious = _BaseDataset._calculate_box_ious(bboxes1, bboxes2, box_format='xywh')
+    np.testing.assert_allclose(ious, [[0., 0.], [1., 0.]])
+    ioas = _BaseDataset._calculate_box_ious(bboxes1, bboxes2, box_format='xywh', do_ioa=True)
+    np.testing.assert_allclose(ioas, [[0., 0.], [1., 0.]])
+
+
+def test_box_ious_empty_input():
+    empty = np.empty((0, 4))
+    boxes = np.array([[0., 0., 10., 10.]])
+    assert _BaseDataset._calculate_box_ious(empty, boxes, box_format='xywh').shape == (0, 1)
+    assert _BaseDataset._calculate_box_ious(boxes, empty, box_format='xywh').shape == (1, 0)
+
+
+@pytest.mark.parametrize('box_format', ['x', 'w', '', 'xyxy'])
+def test_box_ious_invalid_format_raises(box_format):
+    from trackeval.utils import TrackEvalException
+    boxes = np.array([[0., 0., 10., 10.]])
+    with pytest.raises(TrackEvalException, match='box_format'):
+        _BaseDataset._calculate_box_ious(boxes, boxes, box_format=box_format)
+
+
+@pytest.mark.parametrize('box_format', ['xywh', 'x0y0x1y1'])
+@pytest.mark.parametrize('do_ioa', [False, True])
+def test_box_ious_gpu_path(monkeypatch, box_format, do_ioa):
+    # cupy is not assumed to be installed; a numpy-backed stand-in exercises the same code path.
+    from trackeval.datasets import _base_dataset
+    fake_cupy = type('FakeCupy', (), {
+        'asarray': staticmethod(np.asarray), 'asnumpy': staticmethod(np.asarray),
+        'clip': staticmethod(np.clip), 'minimum': staticmethod(np.minimum),
+        'maximum': staticmethod(np.maximum), 'where': staticmethod(np.where)})
+    monkeypatch.setattr(_base_dataset, '_cupy', fake_cupy)
+    monkeypatch.setattr(_base_dataset, 'GPU_IOU_MIN_PAIRS', 1)
+    rng = np.random.RandomState(5)
+    bboxes1 = rng.uniform(0, 100, size=(12, 4))
+    bboxes2 = rng.uniform(0, 100, size=(14, 4))
+    if box_format == 'x0y0x1y1':
+        bboxes1[:, 2:] += bboxes1[:, :2]
+        bboxes2[:, 2:] += bboxes2[:, :2]
+    actual = _BaseDataset._calculate_box_ious(bboxes1, bboxes2, box_format=box_format, do_ioa=do_ioa)
+    expected = _reference_box_ious(bboxes1, bboxes2, box_format=box_format, do_ioa=do_ioa)
+    np.testing.assert_allclose(actual, expected, atol=1e-12)
+
+
+def test_box_ious_does_not_modify_inputs():
+    bboxes1 = np.array([[1., 2., 3., 4.]])
+    bboxes2 = np.array([[2., 2., 4., 4.]])
+    b1_copy, b2_copy = bboxes1.copy(), bboxes2.copy()
+    _BaseDataset._calculate_box_ious(bboxes1, bboxes2, box_format='xywh')
+    np.testing.assert_array_equal(bboxes1, b1_copy)
+    np.testing.assert_array_equal(bboxes2, b2_copy)
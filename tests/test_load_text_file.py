@@ -0,0 +1,135 @@
+import numpy as np
+import pytest
+
+from trackeval.datasets._base_dataset import _BaseDataset
+from trackeval.utils import TrackEvalException
+
+MOT_LINES = [
+    '1,1,10.5,20.5,30,40,1,1,1.0',
+    '1,2,15,25,35,45,1,1,1.0',
+    '2,1,11,21,31,41,0,1,1.0',
+    '3,7,1,2,3,4,1,1,0.5',
+]
+
+
+@pytest.mark.parametrize('force_delimiters', [None, ','])
+def test_load_mot_format(tmp_path, force_delimiters):
+    # Purely numeric files with no filters take the fast path and return float arrays directly.
+    file = tmp_path / 'seq.txt'
+    file.write_text('\n'.join(MOT_LINES) + '\n')
+    read_data, ignore_data = _BaseDataset._load_simple_text_file(str(file), force_delimiters=force_delimiters)
+    assert ignore_data == {}
+    assert sorted(read_data.keys()) == ['1', '2', '3']
+    expected = [[float(x) for x in line.split(',')] for line in MOT_LINES]
+    np.testing.assert_allclose(np.asarray(read_data['1'], dtype=float), expected[:2])
+    np.testing.assert_allclose(np.asarray(read_data['2'], dtype=float), expected[2:3])
+    np.testing.assert_allclose(np.asarray(read_data['3'], dtype=float), expected[3:])
+
+
+def test_numeric_fast_path_remove_negative_ids(tmp_path):
+    file = tmp_path / 'seq.txt'
+    file.write_text('1,1,10,20,30,40,1,1,1.0\n1,-1,10,20,30,40,1,1,1.0\n2,-0.5,10,20,30,40,1,1,1.0\n')
+    read_data, _ = _BaseDataset._load_simple_text_file(str(file), id_col=1, remove_negative_ids=True)
+    assert sorted(read_data.keys()) == ['1', '2']
+    assert len(read_data['1']) == 1
+    # int(float('-0.5')) == 0, so this id does not count as negative.
+    assert len(read_data['2']) == 1
+
+
+def test_numeric_fast_path_ignores_blank_lines(tmp_path):
+    # Blank lines are not rows: counting them used to misalign the fast path's reshape, silently
+    # scrambling columns and fabricating timesteps.
+    file = tmp_path / 'seq.txt'
+    file.write_text('\n'.join(MOT_LINES[:2]) + '\n\n' + '\n'.join(MOT_LINES[2:]) + '\n\n')
+    read_data, _ = _BaseDataset._load_simple_text_file(str(file))
+    assert sorted(read_data.keys()) == ['1', '2', '3']
+    expected = [[float(x) for x in line.split(',')] for line in MOT_LINES]
+    np.testing.assert_allclose(np.asarray(read_data['1'], dtype=float), expected[:2])
+    np.testing.assert_allclose(np.asarray(read_data['2'], dtype=float), expected[2:3])
+    np.testing.assert_allclose(np.asarray(read_data['3'], dtype=float), expected[3:])
+
+
+def test_numeric_fast_path_rejects_ragged_rows(tmp_path):
+    # A short row fails the size check, so parsing falls back to the row loop (string rows).
+    file = tmp_path / 'seq.txt'
+    file.write_text('1,1,10,20\n2,2,10\n')
+    read_data, _ = _BaseDataset._load_simple_text_file(str(file))
+    assert read_data == {'1': [['1', '1', '10', '20']], '2': [['2', '2', '10']]}
+
+
+def test_non_numeric_file_returns_strings(tmp_path):
+    file = tmp_path / 'seq.txt'
+    file.write_text('1,1,10,20,30,40,pedestrian\n')
+    read_data, _ = _BaseDataset._load_simple_text_file(str(file))
+    assert read_data == {'1': [['1', '1', '10', '20', '30', '40', 'pedestrian']]}
+
+
+def test_load_with_extra_spaces_and_trailing_delim(tmp_path):
+    file = tmp_path / 'seq.txt'
+    file.write_text('1, 1, 10, 20, 30, 40, 1, 1, 1.0, \n2, 2, 11, 21, 31, 41, 1, 1, 1.0, \n')
+    read_data, _ = _BaseDataset._load_simple_text_file(str(file))
+    expected = {'1': [[1, 1, 10, 20, 30, 40, 1, 1, 1.0]], '2': [[2, 2, 11, 21, 31, 41, 1, 1, 1.0]]}
+    for key, rows in expected.items():
+        np.testing.assert_allclose(np.asarray(read_data[key], dtype=float), rows)
+
+
+def test_load_with_filters(tmp_path):
+    # After class-name conversion every value is numeric, so rows come back as float arrays.
+    file = tmp_path / 'seq.txt'
+    file.write_text('1 -1 0 0 1 1 car\n1 2 0 0 1 1 pedestrian\n2 3 0 0 1 1 ignored\n')
+    read_data, ignore_data = _BaseDataset._load_simple_text_file(
+        str(file), id_col=1, remove_negative_ids=True,
+        valid_filter={6: ['car', 'pedestrian']},
+        crowd_ignore_filter={6: ['ignored']},
+        convert_filter={6: {'car': 1, 'pedestrian': 2, 'ignored': 0}})
+    assert sorted(read_data.keys()) == ['1']
+    np.testing.assert_allclose(np.asarray(read_data['1'], dtype=float), [[1, 2, 0, 0, 1, 1, 2]])
+    assert sorted(ignore_data.keys()) == ['2']
+    np.testing.assert_allclose(np.asarray(ignore_data['2'], dtype=float), [[2, 3, 0, 0, 1, 1, 0]])
+
+
+def test_load_with_filters_keeps_strings_for_non_numeric_columns(tmp_path):
+    # MOTS-style files carry RLE mask strings, which must stay strings for callers to encode.
+    file = tmp_path / 'seq.txt'
+    file.write_text('1 1 2 100 200 abcRLE0\n1 2 10 100 200 defRLE1\n')
+    read_data, ignore_data = _BaseDataset._load_simple_text_file(
+        str(file), crowd_ignore_filter={2: ['10']}, force_delimiters=' ')
+    assert read_data == {'1': [['1', '1', '2', '100', '200', 'abcRLE0']]}
+    assert ignore_data == {'1': [['1', '2', '10', '100', '200', 'defRLE1']]}
+
+
+@pytest.mark.parametrize('with_pandas', [True, False])
+def test_blank_lines_skipped_on_all_paths(tmp_path, monkeypatch, with_pandas):
+    # Non-numeric data with blank lines parses the same whether or not pandas is installed.
+    if not with_pandas:
+        monkeypatch.setattr(_BaseDataset, '_load_simple_text_file_vectorized', lambda *args: None)
+    file = tmp_path / 'seq.txt'
+    file.write_text('1,1,abc\n\n2,2,def\n\n')
+    read_data, _ = _BaseDataset._load_simple_text_file(str(file))
+    assert read_data == {'1': [['1', '1', 'abc']], '2': [['2', '2', 'def']]}
+
+
+def test_space_padded_rows_on_split_fallback(tmp_path, monkeypatch):
+    # Without pandas the str.split fallback parses space-delimited files; runs of padding spaces
+    # must collapse like the skipinitialspace dialect, not produce empty fields.
+    monkeypatch.setattr(_BaseDataset, '_load_simple_text_file_vectorized', lambda *args: None)
+    file = tmp_path / 'seq.txt'
+    file.write_text('1  1 10 20 30 40  abc\n2 2  11 21 31 41 def\n')
+    read_data, _ = _BaseDataset._load_simple_text_file(str(file), force_delimiters=' ')
+    assert read_data == {'1': [['1', '1', '10', '20', '30', '40', 'abc']],
+                         '2': [['2', '2', '11', '21', '31', '41', 'def']]}
+
+
+def test_load_empty_file(tmp_path):
+    file = tmp_path / 'empty.txt'
+    file.write_text('')
+    read_data, ignore_data = _BaseDataset._load_simple_text_file(str(file))
+    assert read_data == {}
+    assert ignore_data == {}
+
+
+def test_load_invalid_file_raises(tmp_path):
+    file = tmp_path / 'bad.txt'
+    file.write_text('1,1,10\nnot_a_number,2,20\n')
+    with pytest.raises(TrackEvalException):
+        _BaseDataset._load_simple_text_file(str(file))
@@ -0,0 +1,102 @@
+import numpy as np
+
+from trackeval.datasets import _base_dataset, _iou_numba
+from trackeval.datasets._base_dataset import _BaseDataset
+
+
+class _DummyDataset(_BaseDataset):
+    """Minimal dataset over in-memory data, used to exercise the raw-data cache machinery."""
+
+    def __init__(self, source_file):
+        self.source_file = source_file
+        self.load_count = 0
+
+    @staticmethod
+    def get_default_dataset_config():
+        return {}
+
+    def _raw_seq_files(self, tracker, seq):
+        return [self.source_file]
+
+    def _load_raw_file(self, tracker, seq, is_gt):
+        self.load_count += 1
+        prefix = 'gt' if is_gt else 'tracker'
+        return {'num_timesteps': 2,
+                'seq': seq,
+                '%s_ids' % prefix: [np.array([1, 2]), np.array([3])],
+                '%s_dets' % prefix: [np.array([[0., 0., 10., 10.], [5., 5., 10., 10.]], dtype=np.float32),
+                                     np.array([[1., 1., 5., 5.]], dtype=np.float32)]}
+
+    def get_preprocessed_seq_data(self, raw_data, cls):
+        raise NotImplementedError
+
+    def _calculate_similarities(self, gt_dets_t, tracker_dets_t):
+        return self._calculate_box_ious(gt_dets_t, tracker_dets_t, box_format='xywh')
+
+
+def _assert_raw_data_equal(actual, expected):
+    assert sorted(actual.keys()) == sorted(expected.keys())
+    assert actual['num_timesteps'] == expected['num_timesteps']
+    assert actual['seq'] == expected['seq']
+    for key in ['gt_ids', 'gt_dets', 'tracker_ids', 'tracker_dets', 'similarity_scores']:
+        assert len(actual[key]) == len(expected[key])
+        for actual_t, expected_t in zip(actual[key], expected[key]):
+            np.testing.assert_array_equal(actual_t, expected_t)
+
+
+def test_raw_cache_round_trip(tmp_path):
+    source_file = tmp_path / 'seq.txt'
+    source_file.write_text('some raw data\n')
+    dataset = _DummyDataset(str(source_file))
+    dataset.raw_data_cache_dir = str(tmp_path / 'cache')
+
+    first = dataset.get_raw_seq_data('tracker', 'seq-01')
+    assert dataset.load_count == 2  # gt + tracker
+    second = dataset.get_raw_seq_data('tracker', 'seq-01')
+    assert dataset.load_count == 2  # served from cache, no re-parse
+    _assert_raw_data_equal(second, first)
+
+    # Touching the source file invalidates the cache.
+    source_file.write_text('some raw data, changed\n')
+    third = dataset.get_raw_seq_data('tracker', 'seq-01')
+    assert dataset.load_count == 4
+    _assert_raw_data_equal(third, first)
+
+
+def test_raw_cache_keys_include_tracker_and_seq(tmp_path):
+    # Sequences which share their source files (e.g. zipped input) must not share cache entries.
+    source_file = tmp_path / 'seq.txt'
+    source_file.write_text('some raw data\n')
+    dataset = _DummyDataset(str(source_file))
+    dataset.raw_data_cache_dir = str(tmp_path / 'cache')
+
+    dataset.get_raw_seq_data('tracker', 'seq-01')
+    assert dataset.load_count == 2
+    dataset.get_raw_seq_data('tracker', 'seq-02')
+    assert dataset.load_count == 4  # different seq, so no cache hit
+    dataset.get_raw_seq_data('other-tracker', 'seq-01')
+    assert dataset.load_count == 6  # different tracker, so no cache hit
+
+
+def test_similarity_pool_disabled_with_numba(tmp_path, monkeypatch):
+    # The parallel numba kernels are not safe to call from multiple threads, so the thread pool
+    # must stay off whenever numba is available, whatever SIMILARITY_WORKERS says.
+    def _no_pool(*args, **kwargs):
+        raise AssertionError('thread pool must not be used when numba is available')
+    monkeypatch.setattr(_iou_numba, 'NUMBA_AVAILABLE', True)
+    monkeypatch.setattr(_base_dataset, 'ThreadPoolExecutor', _no_pool)
+    source_file = tmp_path / 'seq.txt'
+    source_file.write_text('some raw data\n')
+    dataset = _DummyDataset(str(source_file))
+    dataset.similarity_workers = 4
+    raw_data = dataset.get_raw_seq_data('tracker', 'seq-01')
+    assert len(raw_data['similarity_scores']) == 2
+
+
+def test_raw_cache_disabled_by_default(tmp_path):
+    source_file = tmp_path / 'seq.txt'
+    source_file.write_text('some raw data\n')
+    dataset = _DummyDataset(str(source_file))
+    dataset.get_raw_seq_data('tracker', 'seq-01')
+    dataset.get_raw_seq_data('tracker', 'seq-01')
+    assert dataset.load_count == 4
@@ -0,0 +1,41 @@
+import numpy as np
+import pytest
+
+from trackeval.datasets._base_dataset import _BaseDataset
+from trackeval.utils import TrackEvalException
+
+
+def _make_data(gt_ids, tracker_ids):
+    return {'seq': 'test-seq',
+            'gt_ids': [np.asarray(ids) for ids in gt_ids],
+            'tracker_ids': [np.asarray(ids) for ids in tracker_ids]}
+
+
+def test_unique_ids_ok():
+    data = _make_data(gt_ids=[[1, 2, 3], [], [7]], tracker_ids=[[4, 5], [1], []])
+    _BaseDataset._check_unique_ids(data)
+
+
+def test_duplicate_tracker_ids_raise():
+    data = _make_data(gt_ids=[[1, 2]], tracker_ids=[[3, 4, 3]])
+    with pytest.raises(TrackEvalException, match='Tracker predicts the same ID'):
+        _BaseDataset._check_unique_ids(data)
+
+
+def test_duplicate_gt_ids_raise():
+    data = _make_data(gt_ids=[[1], [2, 2]], tracker_ids=[[1], [1]])
+    with pytest.raises(TrackEvalException, match='Ground-truth has the same ID'):
+        _BaseDataset._check_unique_ids(data)
+
+
+@pytest.mark.parametrize('offset', [0, 10 ** 9])  # small ids take the table path, huge the fallback
+def test_has_duplicate_ids(offset):
+    assert not _BaseDataset._has_duplicate_ids(np.array([], dtype=int))
+    assert not _BaseDataset._has_duplicate_ids(np.array([offset + 1]))
+    assert not _BaseDataset._has_duplicate_ids(np.array([offset + 1, offset + 2, offset + 5]))
+    assert _BaseDataset._has_duplicate_ids(np.array([offset + 1, offset + 2, offset + 1]))
+
+
+def test_has_duplicate_ids_non_integer():
+    assert not _BaseDataset._has_duplicate_ids(np.array([1.5, 2.5]))
+    assert _BaseDataset._has_duplicate_ids(np.array([1.5, 1.5]))
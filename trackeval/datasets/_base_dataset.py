@@ -1,16 +1,54 @@
 import csv
+import hashlib
 import io
 import zipfile
 import os
 import traceback
 import numpy as np
-from copy import deepcopy
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from . import _iou_numba
 from .. import _timing
 from ..utils import TrackEvalException
 
+# Pairwise-IoU workloads below this many gt x tracker pairs stay on the CPU, where kernel launch
+# and host<->device transfer overhead would outweigh any GPU speedup.
+GPU_IOU_MIN_PAIRS = 1 << 20
+
+_cupy = False  # Lazily resolved: False = not yet probed, None = unavailable.
+
+
+def _get_cupy():
+    """Returns the cupy module if it is installed and a CUDA device is present, else None.
+    Only probed on first use, to keep cupy an optional dependency with no import cost otherwise.
+    """
+    global _cupy
+    if _cupy is False:
+        try:
+            import cupy
+            if cupy.cuda.runtime.getDeviceCount() > 0:
+                _cupy = cupy
+            else:
+                _cupy = None
+        except Exception:
+            _cupy = None
+    return _cupy
+
 
 class _BaseDataset(ABC):
+    # Number of worker threads used to compute per-timestep similarity scores in get_raw_seq_data.
+    # Timesteps are independent and NumPy releases the GIL inside its kernels, so they can overlap
+    # on separate cores. Datasets expose this as the SIMILARITY_WORKERS config value; it defaults
+    # to 1 (no thread pool) because the evaluator's USE_PARALLEL mode already runs one process per
+    # core, and per-sequence pools on top of that would oversubscribe them.
+    similarity_workers = 1
+
+    # Directory for the on-disk cache of get_raw_seq_data results. When set (it is off by default),
+    # re-runs for an unchanged tracker/sequence pair load a single .npz instead of re-parsing the
+    # raw text files and re-computing similarities. Only active for datasets that implement
+    # _raw_seq_files, which provides the fingerprint for cache invalidation.
+    raw_data_cache_dir = None
+
     @abstractmethod
     def __init__(self):
         self.tracker_list = None
@@ -88,19 +126,81 @@ class _BaseDataset(ABC):
         We calculate similarity between all gt and tracker classes (not just each class individually) to allow for
         calculation of metrics such as class confusion matrices. Typically the impact of this on performance is low.
         """
+        cache_file = self._raw_cache_file(tracker, seq)
+        if cache_file is not None and os.path.isfile(cache_file):
+            return self._load_raw_cache(cache_file)
+
         # Load raw data.
         raw_gt_data = self._load_raw_file(tracker, seq, is_gt=True)
         raw_tracker_data = self._load_raw_file(tracker, seq, is_gt=False)
         raw_data = {**raw_tracker_data, **raw_gt_data}  # Merges dictionaries
 
         # Calculate similarities for each timestep.
-        similarity_scores = []
-        for t, (gt_dets_t, tracker_dets_t) in enumerate(zip(raw_data['gt_dets'], raw_data['tracker_dets'])):
-            ious = self._calculate_similarities(gt_dets_t, tracker_dets_t)
-            similarity_scores.append(ious)
+        dets_pairs = list(zip(raw_data['gt_dets'], raw_data['tracker_dets']))
+        # numba's default workqueue threading layer is not thread-safe, and the parallel IoU
+        # kernels deadlock when called from multiple threads, so with numba installed the
+        # kernels keep the cores busy themselves and the thread pool stays disabled.
+        workers = 1 if _iou_numba.NUMBA_AVAILABLE else self.similarity_workers
+        if workers > 1 and len(dets_pairs) > 1:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                similarity_scores = list(executor.map(lambda pair: self._calculate_similarities(*pair), dets_pairs))
+        else:
+            similarity_scores = [self._calculate_similarities(gt_dets_t, tracker_dets_t)
+                                 for gt_dets_t, tracker_dets_t in dets_pairs]
         raw_data['similarity_scores'] = similarity_scores
+
+        if cache_file is not None:
+            self._save_raw_cache(cache_file, raw_data)
         return raw_data
 
+    def _raw_seq_files(self, tracker, seq):
+        """ Returns the files which get_raw_seq_data for this tracker/sequence pair is derived
+        from, used to fingerprint the raw-data cache. Datasets which want to support caching
+        should overwrite this; the default of None disables caching.
+        """
+        return None
+
+    def _raw_cache_file(self, tracker, seq):
+        """Returns the raw-data cache file for a tracker/sequence pair, or None if caching is off.
+        The cache key hashes the tracker/sequence pair plus the source files' path, mtime and
+        size, so edited input files miss the cache instead of returning stale data. The pair must
+        be part of the key because the files alone need not identify it (with data_is_zipped all
+        sequences share the same zip files).
+        """
+        if self.raw_data_cache_dir is None:
+            return None
+        files = self._raw_seq_files(tracker, seq)
+        if not files:
+            return None
+        key = hashlib.blake2b(('%s:%s:%s' % (self.get_name(), tracker, seq)).encode())
+        for file in files:
+            stat = os.stat(file)
+            key.update(('%s:%i:%i' % (file, stat.st_mtime_ns, stat.st_size)).encode())
+        return os.path.join(self.raw_data_cache_dir, key.hexdigest() + '.npz')
+
+    @staticmethod
+    def _load_raw_cache(cache_file):
+        with np.load(cache_file, allow_pickle=True) as npz:
+            return {key: (npz[key].item() if npz[key].ndim == 0 else list(npz[key])) for key in npz.files}
+
+    @staticmethod
+    def _save_raw_cache(cache_file, raw_data):
+        os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+        arrays = {}
+        for key, value in raw_data.items():
+            if isinstance(value, list):
+                # Per-timestep lists become 1D object arrays (lengths/shapes vary per timestep).
+                arr = np.empty(len(value), dtype=object)
+                arr[:] = value
+                arrays[key] = arr
+            else:
+                arrays[key] = np.asarray(value)
+        # Write to a temp file first so a concurrent or interrupted run never sees a torn cache.
+        tmp_file = cache_file + '.tmp%i' % os.getpid()
+        with open(tmp_file, 'wb') as fp:
+            np.savez_compressed(fp, **arrays)
+        os.replace(tmp_file, cache_file)
+
     @staticmethod
     def _load_simple_text_file(file, time_col=0, id_col=None, remove_negative_ids=False, valid_filter=None,
                                crowd_ignore_filter=None, convert_filter=None, is_zipped=False, zip_file=None,
@@ -132,7 +232,11 @@ class _BaseDataset(ABC):
 
         Returns read_data and ignore_data.
         Each is a dict (with keys as timesteps as strings) of lists (over dets) of lists (over column values).
-        Note that all data is returned as strings, and must be converted to float/int later if needed.
+        Note that all data is returned as strings, and must be converted to float/int later if needed,
+        except where all values (after any conversion filters) are numeric, in which case each timestep
+        instead maps directly to a 2D float NDArray of its rows (callers converting rows via
+        np.asarray see no difference, and skip per-cell string objects entirely).
+        Note that blank lines are skipped rather than treated as rows.
         Note that timesteps will not be present in the returned dict keys if there are no dets for them
         """
 
@@ -152,51 +256,101 @@ class _BaseDataset(ABC):
                 fp = open(file)
             read_data = {}
             crowd_ignore_data = {}
-            fp.seek(0, os.SEEK_END)
+            data = fp.read()  # Read the whole file in one shot rather than line-by-line iteration.
             # check if file is empty
-            if fp.tell():
-                fp.seek(0)
-                dialect = csv.Sniffer().sniff(fp.readline(), delimiters=force_delimiters)  # Auto determine structure.
-                dialect.skipinitialspace = True  # Deal with extra spaces between columns
-                fp.seek(0)
-                reader = csv.reader(fp, dialect)
+            if data:
+                first_newline = data.find('\n')
+                first_line = data if first_newline == -1 else data[:first_newline]
+                if force_delimiters is not None and len(force_delimiters) == 1 and '"' not in data:
+                    delim = force_delimiters
+                else:
+                    dialect = csv.Sniffer().sniff(first_line, delimiters=force_delimiters)  # Auto determine structure.
+                    dialect.skipinitialspace = True  # Deal with extra spaces between columns
+                    if dialect.quotechar is None or dialect.quotechar not in data:
+                        delim = dialect.delimiter
+                    else:
+                        delim = None
+                if delim is not None and valid_filter is None and not crowd_ignore_filter \
+                        and not convert_filter:
+                    # Filter-free numeric files (the common case for tracker output) can be parsed
+                    # entirely in C with np.fromstring, bypassing the Python row loop. Rows are
+                    # counted with a C-level newline scan, so no per-line string objects are built
+                    # on this path at all.
+                    num_rows = data.count('\n') + (0 if data.endswith('\n') else 1)
+                    if '\n\n' in data or data.startswith('\n'):
+                        # Blank lines are not rows; only files containing them pay for a per-line
+                        # count, so the reshape below cannot be misaligned by them.
+                        num_rows = sum(1 for line in data.splitlines() if line.strip())
+                    ncols = len(first_line.split()) if delim.isspace() else first_line.count(delim) + 1
+                    numeric = _BaseDataset._load_simple_text_file_numeric(
+                        data, num_rows, ncols, delim, time_col, id_col, remove_negative_ids)
+                    if numeric is not None:
+                        fp.close()
+                        return numeric, {}
+                lines = data.splitlines()
+                if delim is not None:
+                    # Vectorized (pandas) path: parse and filter in C instead of a Python row loop.
+                    vectorized = _BaseDataset._load_simple_text_file_vectorized(
+                        data, delim, time_col, id_col, remove_negative_ids, valid_filter,
+                        crowd_ignore_filter, convert_filter)
+                    if vectorized is not None:
+                        fp.close()
+                        return vectorized
+                    # Fast path for the common unquoted case: plain str.split per line avoids
+                    # csv.reader's per-character state machine. For whitespace delimiters,
+                    # split() with no argument collapses runs of whitespace, matching the
+                    # skipinitialspace dialect on space-padded rows; literal delimiters keep
+                    # csv's empty-field semantics.
+                    if delim.isspace():
+                        reader = (line.split() for line in lines)
+                    else:
+                        reader = ([field.strip() for field in line.split(delim)] for line in lines)
+                else:
+                    reader = csv.reader(lines, dialect)
+                # Prebuilt normalized filter tables, hoisted out of the row loop: frozenset
+                # membership is a single O(1) hash per row instead of a linear scan of the
+                # filter's value list.
+                crowd_ignore_items = [(key, frozenset(value)) for key, value in crowd_ignore_filter.items()]
+                convert_items = list(convert_filter.items())
+                if valid_filter is not None:
+                    valid_items = [(key, frozenset(value)) for key, value in valid_filter.items()]
+                else:
+                    valid_items = None
                 for row in reader:
                     try:
                         # Deal with extra trailing spaces at the end of rows
-                        if row[-1] in '':
+                        if row and row[-1] == '':
                             row = row[:-1]
+                        if not row:
+                            # Blank lines are separators, not rows, on all parsing paths (the
+                            # numeric fast path and pandas' skip_blank_lines do the same).
+                            continue
                         timestep = str(int(float(row[time_col])))
                         # Read ignore regions separately.
                         is_ignored = False
-                        for ignore_key, ignore_value in crowd_ignore_filter.items():
+                        for ignore_key, ignore_value in crowd_ignore_items:
                             if row[ignore_key].lower() in ignore_value:
                                 # Convert values in one column (e.g. string to id)
-                                for convert_key, convert_value in convert_filter.items():
+                                for convert_key, convert_value in convert_items:
                                     row[convert_key] = convert_value[row[convert_key].lower()]
                                 # Save data separated by timestep.
-                                if timestep in crowd_ignore_data.keys():
-                                    crowd_ignore_data[timestep].append(row)
-                                else:
-                                    crowd_ignore_data[timestep] = [row]
+                                crowd_ignore_data.setdefault(timestep, []).append(row)
                                 is_ignored = True
                         if is_ignored:  # if det is an ignore region, it cannot be a normal det.
                             continue
                         # Exclude some dets if not valid.
-                        if valid_filter is not None:
-                            for key, value in valid_filter.items():
+                        if valid_items is not None:
+                            for key, value in valid_items:
                                 if row[key].lower() not in value:
                                     continue
                         if remove_negative_ids:
                             if int(float(row[id_col])) < 0:
                                 continue
                         # Convert values in one column (e.g. string to id)
-                        for convert_key, convert_value in convert_filter.items():
+                        for convert_key, convert_value in convert_items:
                             row[convert_key] = convert_value[row[convert_key].lower()]
                         # Save data separated by timestep.
-                        if timestep in read_data.keys():
-                            read_data[timestep].append(row)
-                        else:
-                            read_data[timestep] = [row]
+                        read_data.setdefault(timestep, []).append(row)
                     except Exception:
                         exc_str_init = 'In file %s the following line cannot be read correctly: \n' % os.path.basename(
                             file)
@@ -211,6 +365,101 @@ class _BaseDataset(ABC):
                     file))
         return read_data, crowd_ignore_data
 
+    @staticmethod
+    def _load_simple_text_file_numeric(data, num_rows, ncols, delim, time_col, id_col, remove_negative_ids):
+        """ Fast path of _load_simple_text_file for purely numeric files with no filters.
+
+        Parses every value in C via np.fromstring and groups rows by timestep with a stable
+        argsort + np.split, so no Python code runs per row or per cell. The timestep dict then
+        holds 2D float ndarrays rather than lists of string lists, which spares callers their
+        usual string-to-float conversion. Returns None when the file is not num_rows x ncols of
+        numeric data, in which case the caller parses it row by row as usual. The exact size
+        check matters because np.fromstring stops silently at the first non-numeric token, so a
+        partial parse must never survive the reshape.
+        """
+        try:
+            # np.fromstring treats whitespace (including newlines) as separators alongside sep, so
+            # mapping the delimiter to spaces lets one call parse the whole file.
+            values = np.fromstring(data if delim.isspace() else data.replace(delim, ' '), sep=' ')
+            if num_rows == 0 or values.size != num_rows * ncols:
+                return None
+            table = values.reshape(num_rows, ncols)
+            if remove_negative_ids:
+                # astype(int) truncates towards zero, matching int(float(...)) in the row loop.
+                table = table[table[:, id_col].astype(int) >= 0]
+            timesteps = table[:, time_col].astype(int)
+            order = np.argsort(timesteps, kind='stable')  # Stable: keeps file order per timestep.
+            unique_times, first_indices = np.unique(timesteps[order], return_index=True)
+            return {str(t): rows for t, rows in zip(unique_times, np.split(table[order], first_indices[1:]))}
+        except (ValueError, IndexError):
+            return None
+
+    @staticmethod
+    def _load_simple_text_file_vectorized(data, delim, time_col, id_col, remove_negative_ids, valid_filter,
+                                          crowd_ignore_filter, convert_filter):
+        """ Vectorized (pandas-based) counterpart of the row loop in _load_simple_text_file.
+
+        Parses all rows in C via pandas.read_csv, applies the filters as columnar operations and
+        groups rows by timestep in a single pass, instead of paying interpreter overhead per cell.
+        Returns (read_data, crowd_ignore_data) with the same format and semantics as the row loop.
+        Returns None when the caller should fall back to the row loop instead: pandas missing,
+        ragged or otherwise unusual data, or data that would raise an error (so the row loop can
+        produce its usual error message).
+        """
+        try:
+            import pandas as pd
+        except ImportError:
+            return None
+        if len(crowd_ignore_filter) > 1:
+            # The row loop appends a row once per matching ignore key; keep that behaviour exact.
+            return None
+        try:
+            # read_csv's default skip_blank_lines matches the other parsing paths.
+            df = pd.read_csv(io.StringIO(data), sep=delim, header=None, dtype=str,
+                             skipinitialspace=True, keep_default_na=False)
+            # Deal with extra trailing spaces at the end of rows.
+            if (df.iloc[:, -1] == '').all():
+                df = df.iloc[:, :-1]
+            elif (df.iloc[:, -1] == '').any():
+                return None
+            timesteps = df.iloc[:, time_col].astype(float).astype(int).astype(str)
+            ignore_mask = pd.Series(False, index=df.index)
+            for ignore_key, ignore_value in crowd_ignore_filter.items():
+                ignore_mask |= df.iloc[:, ignore_key].str.lower().isin(ignore_value)
+            keep_mask = ~ignore_mask
+            # Note that, as in the row loop, valid_filter does not exclude any rows here.
+            if remove_negative_ids:
+                keep_mask &= df.iloc[:, id_col].astype(float).astype(int) >= 0
+            # Convert values in one column (e.g. string to id)
+            if convert_filter:
+                # Converted values need not be strings, so widen the columns to object dtype.
+                df = df.astype(object)
+            for convert_key, convert_value in convert_filter.items():
+                converted = df.iloc[:, convert_key].str.lower().map(convert_value)
+                if converted.isna().any():
+                    return None
+                df.iloc[:, convert_key] = converted
+            # Where every value (after conversion filters) is numeric, materialize float arrays
+            # directly so no per-cell Python string objects are ever built; otherwise (e.g. MOTS
+            # RLE columns) keep the lists-of-strings format, which callers index per cell.
+            try:
+                numeric = df.to_numpy(dtype=float)
+            except (ValueError, TypeError):
+                numeric = None
+            if numeric is not None:
+                read_data = {t: numeric[rows.index.to_numpy()]
+                             for t, rows in df[keep_mask].groupby(timesteps[keep_mask].values, sort=False)}
+                crowd_ignore_data = {t: numeric[rows.index.to_numpy()]
+                                     for t, rows in df[ignore_mask].groupby(timesteps[ignore_mask].values, sort=False)}
+            else:
+                read_data = {t: rows.values.tolist()
+                             for t, rows in df[keep_mask].groupby(timesteps[keep_mask].values, sort=False)}
+                crowd_ignore_data = {t: rows.values.tolist()
+                                     for t, rows in df[ignore_mask].groupby(timesteps[ignore_mask].values, sort=False)}
+            return read_data, crowd_ignore_data
+        except Exception:
+            return None
+
     @staticmethod
     def _calculate_mask_ious(masks1, masks2, is_encoded=False, do_ioa=False):
         """ Calculates the IOU (intersection over union) between two arrays of segmentation masks.
@@ -245,45 +494,159 @@ class _BaseDataset(ABC):
         return ious
 
     @staticmethod
-    def _calculate_box_ious(bboxes1, bboxes2, box_format='xywh', do_ioa=False):
+    def _calculate_box_ious(bboxes1, bboxes2, box_format='xywh', do_ioa=False, dtype=None,
+                            areas1=None, areas2=None, out=None):
         """ Calculates the IOU (intersection over union) between two arrays of boxes.
         Allows variable box formats ('xywh' and 'x0y0x1y1').
         If do_ioa (intersection over area) , then calculates the intersection over the area of boxes1 - this is commonly
         used to determine if detections are within crowd ignore region.
+        dtype optionally selects a reduced-precision compute type (e.g. np.float16) for the dominant
+        pairwise broadcast, halving the memory bandwidth of the (N,M) intermediates. Box coordinates
+        in MOT-style datasets are integer-valued and well within float16 range, but areas are not,
+        so the area/union/division stage always runs in at least float32.
+        areas1/areas2 optionally provide precomputed box areas, so callers which evaluate the same
+        boxes repeatedly (e.g. over many thresholds) do not redo the area arithmetic each call.
+        out optionally provides a preallocated (N,M) result buffer (e.g. a larger scratch array
+        sliced to shape) to write into instead of allocating a fresh array per call. Note that the
+        similarity matrices built in get_raw_seq_data are all retained, so a shared scratch buffer
+        is only safe for callers which consume each result before the next call.
         """
-        if box_format in 'xywh':
+        if dtype is not None:
+            bboxes1 = bboxes1.astype(dtype, copy=False)
+            bboxes2 = bboxes2.astype(dtype, copy=False)
+        if bboxes1.shape[0] * bboxes2.shape[0] >= GPU_IOU_MIN_PAIRS \
+                and bboxes1.dtype != np.float16 and bboxes2.dtype != np.float16 \
+                and areas1 is None and areas2 is None and out is None:
+            # Very large pairwise workloads (crowd scenes, dense trackers) are offloaded to the GPU
+            # when cupy is installed and a CUDA device is present; otherwise fall through.
+            cupy = _get_cupy()
+            if cupy is not None:
+                return _BaseDataset._calculate_box_ious_cupy(cupy, bboxes1, bboxes2, box_format, do_ioa)
+        if _iou_numba.NUMBA_AVAILABLE and bboxes1.dtype != np.float16 and bboxes2.dtype != np.float16 \
+                and areas1 is None and areas2 is None and out is None:
+            # Fused single-pass kernel with no (N,M) temporaries; falls through to NumPy if numba
+            # is not installed. float32 inputs stay in single precision and use the wider-SIMD
+            # float32 specializations of the kernels.
+            if bboxes1.dtype == np.float32 and bboxes2.dtype == np.float32:
+                dtype = np.float32
+                iou_kernel, ioa_kernel = _iou_numba.box_iou_xyxy_f32, _iou_numba.box_ioa_xyxy_f32
+            else:
+                dtype = np.dtype(float)
+                iou_kernel, ioa_kernel = _iou_numba.box_iou_xyxy, _iou_numba.box_ioa_xyxy
+            if box_format == 'xywh':
+                b1 = _iou_numba.xywh_to_xyxy(np.ascontiguousarray(bboxes1, dtype=dtype))
+                b2 = _iou_numba.xywh_to_xyxy(np.ascontiguousarray(bboxes2, dtype=dtype))
+            elif box_format == 'x0y0x1y1':
+                b1 = np.ascontiguousarray(bboxes1, dtype=dtype)
+                b2 = np.ascontiguousarray(bboxes2, dtype=dtype)
+            else:
+                raise (TrackEvalException('box_format %s is not implemented' % box_format))
+            eps = np.finfo(dtype).eps
+            if do_ioa:
+                return ioa_kernel(b1, b2, eps)
+            else:
+                return iou_kernel(b1, b2, eps)
+
+        if box_format == 'xywh':
             # layout: (x0, y0, w, h)
-            bboxes1 = deepcopy(bboxes1)
-            bboxes2 = deepcopy(bboxes2)
-
-            bboxes1[:, 2] = bboxes1[:, 0] + bboxes1[:, 2]
-            bboxes1[:, 3] = bboxes1[:, 1] + bboxes1[:, 3]
-            bboxes2[:, 2] = bboxes2[:, 0] + bboxes2[:, 2]
-            bboxes2[:, 3] = bboxes2[:, 1] + bboxes2[:, 3]
-        elif box_format not in 'x0y0x1y1':
+            # Views into the inputs plus cheap slice arithmetic avoid deepcopying both arrays, and
+            # areas come straight from w*h in the same pass, with no corner-coordinate round trip.
+            # Products run in at least float32 (see the dtype note above).
+            b1_x0, b1_y0 = bboxes1[:, 0], bboxes1[:, 1]
+            b1_x1 = b1_x0 + bboxes1[:, 2]
+            b1_y1 = b1_y0 + bboxes1[:, 3]
+            b2_x0, b2_y0 = bboxes2[:, 0], bboxes2[:, 1]
+            b2_x1 = b2_x0 + bboxes2[:, 2]
+            b2_y1 = b2_y0 + bboxes2[:, 3]
+            if areas1 is None:
+                areas1 = np.multiply(bboxes1[:, 2], bboxes1[:, 3],
+                                     dtype=np.float32 if bboxes1.dtype == np.float16 else None)
+            if areas2 is None:
+                areas2 = np.multiply(bboxes2[:, 2], bboxes2[:, 3],
+                                     dtype=np.float32 if bboxes2.dtype == np.float16 else None)
+        elif box_format == 'x0y0x1y1':
+            b1_x0, b1_y0, b1_x1, b1_y1 = bboxes1[:, 0], bboxes1[:, 1], bboxes1[:, 2], bboxes1[:, 3]
+            b2_x0, b2_y0, b2_x1, b2_y1 = bboxes2[:, 0], bboxes2[:, 1], bboxes2[:, 2], bboxes2[:, 3]
+        else:
             raise (TrackEvalException('box_format %s is not implemented' % box_format))
 
         # layout: (x0, y0, x1, y1)
-        min_ = np.minimum(bboxes1[:, np.newaxis, :], bboxes2[np.newaxis, :, :])
-        max_ = np.maximum(bboxes1[:, np.newaxis, :], bboxes2[np.newaxis, :, :])
-        intersection = np.maximum(min_[..., 2] - max_[..., 0], 0) * np.maximum(min_[..., 3] - max_[..., 1], 0)
-        area1 = (bboxes1[..., 2] - bboxes1[..., 0]) * (bboxes1[..., 3] - bboxes1[..., 1])
-
+        # Broadcast per-coordinate (N,M) arrays in-place rather than materializing (N,M,4) min/max tensors.
+        iw = np.minimum(b1_x1[:, np.newaxis], b2_x1[np.newaxis, :])
+        np.subtract(iw, np.maximum(b1_x0[:, np.newaxis], b2_x0[np.newaxis, :]), out=iw)
+        np.clip(iw, 0, None, out=iw)
+        ih = np.minimum(b1_y1[:, np.newaxis], b2_y1[np.newaxis, :])
+        np.subtract(ih, np.maximum(b1_y0[:, np.newaxis], b2_y0[np.newaxis, :]), out=ih)
+        np.clip(ih, 0, None, out=ih)
+        if iw.dtype == np.float16:
+            # Products of box dimensions can overflow float16, so only the broadcast stage above
+            # runs in half precision; areas, unions and the division run in float32.
+            iw = iw.astype(np.float32)
+            ih = ih.astype(np.float32)
+            b1_x0, b1_y0, b1_x1, b1_y1 = (c.astype(np.float32) for c in (b1_x0, b1_y0, b1_x1, b1_y1))
+            b2_x0, b2_y0, b2_x1, b2_y1 = (c.astype(np.float32) for c in (b2_x0, b2_y0, b2_x1, b2_y1))
+        intersection = iw * ih
+        area1 = areas1 if areas1 is not None else (b1_x1 - b1_x0) * (b1_y1 - b1_y0)
+
+        # A single masked divide avoids the gather/scatter copies of boolean fancy indexing:
+        # invalid entries stay at the zero the output was initialized with.
+        eps = np.finfo('float').eps
+        if out is not None:
+            result = out
+            result[...] = 0
+        else:
+            # The result must be floating point even for integer box coordinates, since the
+            # masked divides below cannot cast their float output into an integer buffer.
+            result = np.zeros(intersection.shape, dtype=np.result_type(intersection, np.float32))
         if do_ioa:
-            ioas = np.zeros_like(intersection)
-            valid_mask = area1 > 0 + np.finfo('float').eps
-            ioas[valid_mask, :] = intersection[valid_mask, :] / area1[valid_mask][:, np.newaxis]
+            np.divide(intersection, area1[:, np.newaxis], out=result, where=area1[:, np.newaxis] > eps)
+        else:
+            area2 = areas2 if areas2 is not None else (b2_x1 - b2_x0) * (b2_y1 - b2_y0)
+            # Build the union in a single buffer with in-place ops (one (N,M) allocation and one
+            # extra pass over it) rather than materializing the area sum and the union separately.
+            union = np.add(area1[:, np.newaxis], area2[np.newaxis, :])
+            np.subtract(union, intersection, out=union)
+            valid_mask = (area1 > eps)[:, np.newaxis] & (area2 > eps)[np.newaxis, :]
+            valid_mask &= union > eps
+            np.divide(intersection, union, out=result, where=valid_mask)
+        return result
 
-            return ioas
+    @staticmethod
+    def _calculate_box_ious_cupy(cupy, bboxes1, bboxes2, box_format, do_ioa):
+        """ GPU (cupy) implementation of _calculate_box_ious for very large box counts.
+        Mirrors the NumPy path: inputs are copied to the device, the pairwise scores computed
+        there, and the result copied back as a NumPy array. Zero-area boxes and empty unions
+        score 0, as on the CPU paths.
+        """
+        b1 = cupy.asarray(bboxes1)
+        b2 = cupy.asarray(bboxes2)
+        if box_format == 'xywh':
+            b1_x0, b1_y0 = b1[:, 0], b1[:, 1]
+            b1_x1, b1_y1 = b1_x0 + b1[:, 2], b1_y0 + b1[:, 3]
+            b2_x0, b2_y0 = b2[:, 0], b2[:, 1]
+            b2_x1, b2_y1 = b2_x0 + b2[:, 2], b2_y0 + b2[:, 3]
+            area1 = b1[:, 2] * b1[:, 3]
+            area2 = b2[:, 2] * b2[:, 3]
+        elif box_format == 'x0y0x1y1':
+            b1_x0, b1_y0, b1_x1, b1_y1 = b1[:, 0], b1[:, 1], b1[:, 2], b1[:, 3]
+            b2_x0, b2_y0, b2_x1, b2_y1 = b2[:, 0], b2[:, 1], b2[:, 2], b2[:, 3]
+            area1 = (b1_x1 - b1_x0) * (b1_y1 - b1_y0)
+            area2 = (b2_x1 - b2_x0) * (b2_y1 - b2_y0)
         else:
-            area2 = (bboxes2[..., 2] - bboxes2[..., 0]) * (bboxes2[..., 3] - bboxes2[..., 1])
-            union = area1[:, np.newaxis] + area2[np.newaxis, :] - intersection
-            intersection[area1 <= 0 + np.finfo('float').eps, :] = 0
-            intersection[:, area2 <= 0 + np.finfo('float').eps] = 0
-            intersection[union <= 0 + np.finfo('float').eps] = 0
-            union[union <= 0 + np.finfo('float').eps] = 1
-            ious = intersection / union
-            return ious
+            raise (TrackEvalException('box_format %s is not implemented' % box_format))
+        iw = cupy.clip(cupy.minimum(b1_x1[:, None], b2_x1[None, :])
+                       - cupy.maximum(b1_x0[:, None], b2_x0[None, :]), 0, None)
+        ih = cupy.clip(cupy.minimum(b1_y1[:, None], b2_y1[None, :])
+                       - cupy.maximum(b1_y0[:, None], b2_y0[None, :]), 0, None)
+        intersection = iw * ih
+        eps = np.finfo('float').eps
+        if do_ioa:
+            result = cupy.where(area1[:, None] > eps, intersection / area1[:, None], 0)
+        else:
+            union = area1[:, None] + area2[None, :] - intersection
+            valid_mask = (area1 > eps)[:, None] & (area2 > eps)[None, :] & (union > eps)
+            result = cupy.where(valid_mask, intersection / union, 0)
+        return cupy.asnumpy(result)
 
     @staticmethod
     def _calculate_euclidean_similarity(dets1, dets2, zero_distance=2.0):
@@ -296,6 +659,27 @@ class _BaseDataset(ABC):
         sim = np.maximum(0, 1 - dist/zero_distance)
         return sim
 
+    @staticmethod
+    def _has_duplicate_ids(ids):
+        """Checks whether an array of ids contains any id more than once.
+        This only detects whether duplicates exist, which is cheaper than counting each id
+        (the duplicate ids themselves are only extracted on the error path).
+        Track ids are typically small non-negative integers, in which case a branchless scatter
+        into a boolean table gives a linear-time cache-friendly check with no sort and no hashing.
+        Ids which are non-integer or too large for the table fall back to the sort-based check.
+        """
+        ids = np.asarray(ids)
+        if ids.size < 2:
+            return False
+        if ids.dtype.kind in 'iu':
+            min_id = ids.min()
+            max_id = ids.max()
+            if min_id >= 0 and max_id < 1 << 20:
+                seen = np.zeros(int(max_id) + 1, dtype=bool)
+                seen[ids] = True
+                return int(seen.sum()) != ids.size
+        return np.unique(ids).size != ids.size
+
     @staticmethod
     def _check_unique_ids(data, after_preproc=False):
         """Check the requirement that the tracker_ids and gt_ids are unique per timestep"""
@@ -303,8 +687,8 @@ class _BaseDataset(ABC):
         tracker_ids = data['tracker_ids']
         for t, (gt_ids_t, tracker_ids_t) in enumerate(zip(gt_ids, tracker_ids)):
             if len(tracker_ids_t) > 0:
-                unique_ids, counts = np.unique(tracker_ids_t, return_counts=True)
-                if np.max(counts) != 1:
+                if _BaseDataset._has_duplicate_ids(tracker_ids_t):
+                    unique_ids, counts = np.unique(tracker_ids_t, return_counts=True)
                     duplicate_ids = unique_ids[counts > 1]
                     exc_str_init = 'Tracker predicts the same ID more than once in a single timestep ' \
                                    '(seq: %s, frame: %i, ids:' % (data['seq'], t+1)
@@ -314,8 +698,8 @@ class _BaseDataset(ABC):
                                         'so ids may not be as in file, and something seems wrong with preproc.'
                     raise TrackEvalException(exc_str)
             if len(gt_ids_t) > 0:
-                unique_ids, counts = np.unique(gt_ids_t, return_counts=True)
-                if np.max(counts) != 1:
+                if _BaseDataset._has_duplicate_ids(gt_ids_t):
+                    unique_ids, counts = np.unique(gt_ids_t, return_counts=True)
                     duplicate_ids = unique_ids[counts > 1]
                     exc_str_init = 'Ground-truth has the same ID more than once in a single timestep ' \
                                    '(seq: %s, frame: %i, ids:' % (data['seq'], t+1)
@@ -28,6 +28,7 @@ class Kitti2DBox(_BaseDataset):
             'TRACKER_SUB_FOLDER': 'data',  # Tracker files are in TRACKER_FOLDER/tracker_name/TRACKER_SUB_FOLDER
             'OUTPUT_SUB_FOLDER': '',  # Output files are saved in OUTPUT_FOLDER/tracker_name/OUTPUT_SUB_FOLDER
             'TRACKER_DISPLAY_NAMES': None,  # Names of trackers to display, if None: TRACKERS_TO_EVAL
+            'SIMILARITY_WORKERS': 1,  # Threads for per-timestep similarity scores (keep at 1 with USE_PARALLEL; unused if numba is installed)
         }
         return default_config
 
@@ -41,6 +42,7 @@ class Kitti2DBox(_BaseDataset):
         self.should_classes_combine = False
         self.use_super_categories = False
         self.data_is_zipped = self.config['INPUT_AS_ZIP']
+        self.similarity_workers = self.config['SIMILARITY_WORKERS']
 
         self.output_fol = self.config['OUTPUT_FOLDER']
         if self.output_fol is None:
@@ -191,7 +193,10 @@ class Kitti2DBox(_BaseDataset):
             time_key = str(t)
             if time_key in read_data.keys():
                 time_data = np.asarray(read_data[time_key], dtype=np.float)
-                raw_data['dets'][t] = np.atleast_2d(time_data[:, 6:10])
+                # Contiguous float32 layout: the IoU kernels consume this directly without
+                # per-timestep dtype coercion or copies.
+                raw_data['dets'][t] = np.ascontiguousarray(np.atleast_2d(time_data[:, 6:10]),
+                                                           dtype=np.float32)
                 raw_data['ids'][t] = np.atleast_1d(time_data[:, 1]).astype(int)
                 raw_data['classes'][t] = np.atleast_1d(time_data[:, 2]).astype(int)
                 if is_gt:
@@ -204,7 +209,7 @@ class Kitti2DBox(_BaseDataset):
                     else:
                         raw_data['tracker_confidences'][t] = np.ones(time_data.shape[0])
             else:
-                raw_data['dets'][t] = np.empty((0, 4))
+                raw_data['dets'][t] = np.empty((0, 4), dtype=np.float32)
                 raw_data['ids'][t] = np.empty(0).astype(int)
                 raw_data['classes'][t] = np.empty(0).astype(int)
                 if is_gt:
@@ -216,9 +221,10 @@ class Kitti2DBox(_BaseDataset):
             if is_gt:
                 if time_key in ignore_data.keys():
                     time_ignore = np.asarray(ignore_data[time_key], dtype=np.float)
-                    raw_data['gt_crowd_ignore_regions'][t] = np.atleast_2d(time_ignore[:, 6:10])
+                    raw_data['gt_crowd_ignore_regions'][t] = np.ascontiguousarray(
+                        np.atleast_2d(time_ignore[:, 6:10]), dtype=np.float32)
                 else:
-                    raw_data['gt_crowd_ignore_regions'][t] = np.empty((0, 4))
+                    raw_data['gt_crowd_ignore_regions'][t] = np.empty((0, 4), dtype=np.float32)
 
         if is_gt:
             key_map = {'ids': 'gt_ids',
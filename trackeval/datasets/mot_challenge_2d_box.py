@@ -37,6 +37,7 @@ class MotChallenge2DBox(_BaseDataset):
             'SKIP_SPLIT_FOL': False,  # If False, data is in GT_FOLDER/BENCHMARK-SPLIT_TO_EVAL/ and in
                                       # TRACKERS_FOLDER/BENCHMARK-SPLIT_TO_EVAL/tracker/
                                       # If True, then the middle 'benchmark-split' folder is skipped for both.
+            'SIMILARITY_WORKERS': 1,  # Threads for per-timestep similarity scores (keep at 1 with USE_PARALLEL; unused if numba is installed)
         }
         return default_config
 
@@ -59,6 +60,7 @@ class MotChallenge2DBox(_BaseDataset):
         self.use_super_categories = False
         self.data_is_zipped = self.config['INPUT_AS_ZIP']
         self.do_preproc = self.config['DO_PREPROC']
+        self.similarity_workers = self.config['SIMILARITY_WORKERS']
 
         self.output_fol = self.config['OUTPUT_FOLDER']
         if self.output_fol is None:
@@ -171,6 +173,13 @@ class MotChallenge2DBox(_BaseDataset):
                     seq_lengths[seq] = int(ini_data['Sequence']['seqLength'])
         return seq_list, seq_lengths
 
+    def _raw_seq_files(self, tracker, seq):
+        if self.data_is_zipped:
+            return [os.path.join(self.gt_fol, 'data.zip'),
+                    os.path.join(self.tracker_fol, tracker, self.tracker_sub_fol + '.zip')]
+        return [self.config["GT_LOC_FORMAT"].format(gt_folder=self.gt_fol, seq=seq),
+                os.path.join(self.tracker_fol, tracker, self.tracker_sub_fol, seq + '.txt')]
+
     def _load_raw_file(self, tracker, seq, is_gt):
         """Load a file (gt or tracker) in the MOT Challenge 2D box format
 
@@ -235,7 +244,10 @@ class MotChallenge2DBox(_BaseDataset):
                             'Cannot convert tracking data from tracker %s, sequence %s to float. Is data corrupted?' % (
                                 tracker, seq))
                 try:
-                    raw_data['dets'][t] = np.atleast_2d(time_data[:, 2:6])
+                    # Contiguous float32 layout: the IoU kernels consume this directly without
+                    # per-timestep dtype coercion or copies.
+                    raw_data['dets'][t] = np.ascontiguousarray(np.atleast_2d(time_data[:, 2:6]),
+                                                               dtype=np.float32)
                     raw_data['ids'][t] = np.atleast_1d(time_data[:, 1]).astype(int)
                 except IndexError:
                     if is_gt:
@@ -261,7 +273,7 @@ class MotChallenge2DBox(_BaseDataset):
                 else:
                     raw_data['tracker_confidences'][t] = np.atleast_1d(time_data[:, 6])
             else:
-                raw_data['dets'][t] = np.empty((0, 4))
+                raw_data['dets'][t] = np.empty((0, 4), dtype=np.float32)
                 raw_data['ids'][t] = np.empty(0).astype(int)
                 raw_data['classes'][t] = np.empty(0).astype(int)
                 if is_gt:
@@ -270,7 +282,7 @@ class MotChallenge2DBox(_BaseDataset):
                 else:
                     raw_data['tracker_confidences'][t] = np.empty(0)
             if is_gt:
-                raw_data['gt_crowd_ignore_regions'][t] = np.empty((0, 4))
+                raw_data['gt_crowd_ignore_regions'][t] = np.empty((0, 4), dtype=np.float32)
 
         if is_gt:
             key_map = {'ids': 'gt_ids',